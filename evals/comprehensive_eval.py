@@ -2,142 +2,399 @@
 """
 Comprehensive evaluation test that verifies both agent functionality and tracing
 """
+import argparse
+import asyncio
+import contextlib
+import hashlib
 import json
 import os
-import subprocess
 import time
-import requests
-from openai import OpenAI
+from collections import deque
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 import re
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, concurrent runs may race
+    fcntl = None
+
+try:
+    import orjson
+
+    def _dump_results(results: List[Dict[str, Any]]) -> bytes:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+
+    _load_results = orjson.loads
+except ImportError:
+    def _dump_results(results: List[Dict[str, Any]]) -> bytes:
+        return json.dumps(results, indent=2).encode("utf-8")
+
+    _load_results = json.loads
 
 # Load environment variables from .env file
 load_dotenv()
 
+def _openai_client() -> Optional[AsyncOpenAI]:
+    """Async OpenAI client for one evaluation run, or None if no API key is set"""
+    api_key = os.getenv('OPENAI_API_KEY')
+    return AsyncOpenAI(api_key=api_key) if api_key else None
+
+# ISO-8601 timestamps like YYYY-MM-DDTHH:MM:SSZ, compiled once per process
+ISO8601_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?')
+
+# Line prefixes the TypeScript agent uses for debug output rather than its answer,
+# encoded so raw ts-node output can be scanned without decoding it first
+_DEBUG_PREFIXES = tuple(
+    prefix.encode("utf-8") for prefix in ("🤖", "📝", "✅", "🆔", "📊", "🔗", "📈", "🏷️", "🔄", "🎯")
+)
+
+# Consistency scores indexed by the flag bitmask built in
+# test_python_vs_typescript_consistency: (py_iso << 3) | (ts_iso << 2) | (py_ts << 1) | ts_ts.
+# Full marks when both sides agree on mentioning ISO, half otherwise.
+_CONSISTENCY_SCORES = tuple(
+    1.0 if (flags >> 3) & 1 == (flags >> 2) & 1 else 0.5 for flags in range(16)
+)
+
+# Upper bound on ts-node/node processes running at once
+MAX_CONCURRENT_SPAWNS = 2
+
+# Seconds to wait for the TypeScript agent and the longer full test suite
+AGENT_TIMEOUT = 30
+TEST_SUITE_TIMEOUT = 120
+
+# Bytes read from the test suite's stdout per call
+STDOUT_CHUNK_SIZE = 64 * 1024
+
+# Exact-match cache for OpenAI completions, so re-running the harness with
+# the same fixed query doesn't pay for another API round trip
+COMPLETION_CACHE_PATH = os.path.join(".cache", "openai_completions.json")
+COMPLETION_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Results of the last passing run are kept per input fingerprint, so a re-run
+# with unchanged sources, config and test selection can skip the slow tests.
+# They expire with the completion cache, which the consistency result relies on.
+RESULTS_CACHE_DIR = ".cache"
+RESULTS_CACHE_TTL = COMPLETION_CACHE_TTL  # seconds
+
+# Live health checks are always re-run; a cached "reachable" proves nothing
+UNCACHED_TESTS = ("connectivity",)
+
+# Names accepted by --only, in the order results are reported
+TEST_NAMES = ("connectivity", "trace", "consistency")
+
+# Summary line for each passing test, keyed by its result's test_name
+_VERIFIED_LINES = {
+    "aspire_connectivity": "   ✅ Infrastructure connectivity verified",
+    "trace_generation": "   ✅ Tracing system working",
+    "python_vs_typescript_consistency": "   ✅ Agent implementations consistent",
+}
+
+def _completion_cache_key(model: str, query: str) -> str:
+    """Key a cached completion on the model and the exact query text"""
+    return hashlib.sha1(f"{model}\x00{query}".encode("utf-8")).hexdigest()
+
+def _read_completion_cache() -> Dict[str, Dict[str, Any]]:
+    """Read the on-disk completion cache, treating a missing or corrupt file as empty"""
+    try:
+        with open(COMPLETION_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+@contextlib.contextmanager
+def _completion_cache_file_lock() -> Iterator[None]:
+    """Hold an exclusive lock on the completion cache across harness processes"""
+    os.makedirs(os.path.dirname(COMPLETION_CACHE_PATH), exist_ok=True)
+    with open(COMPLETION_CACHE_PATH + ".lock", 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _store_completion(key: str, entry: Dict[str, Any]) -> None:
+    """Merge one entry into the on-disk cache without dropping entries other runs wrote"""
+    with _completion_cache_file_lock():
+        cache = _read_completion_cache()
+        cache[key] = entry
+        tmp_path = COMPLETION_CACHE_PATH + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, COMPLETION_CACHE_PATH)
+
+def _load_cached_results(path: str) -> Optional[List[Dict[str, Any]]]:
+    """Load cached results if the file exists and is younger than RESULTS_CACHE_TTL"""
+    try:
+        if time.time() - os.path.getmtime(path) >= RESULTS_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return _load_results(f.read())
+    except (OSError, ValueError):
+        return None
+
 class ComprehensiveEval:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # One OpenAI client per evaluator: its HTTPX pool belongs to the event
+        # loop that uses it, so it must not outlive this run's asyncio.run()
+        self.client = _openai_client()
+        # One keep-alive pool for the Aspire probes so both hit warm connections
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=30)
+        )
         self.results = []
         self.ts_agent_path = "../agents-sdk-ts"
+        self._spawn_sem = asyncio.Semaphore(MAX_CONCURRENT_SPAWNS)
+        # Serializes cache lookups within this run; the file lock covers other processes
+        self._completion_lock = asyncio.Lock()
+        # Resolve the locally installed ts-node once so spawns skip npx's lookup
+        self._ts_node_bin = os.path.realpath(
+            os.path.join(self.ts_agent_path, "node_modules", ".bin", "ts-node")
+        )
+        # Transpile only; type checking is left to `npm run typecheck`
+        self._ts_env = {**os.environ, "TS_NODE_TRANSPILE_ONLY": "1"}
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections"""
+        await self.http.aclose()
+        if self.client is not None:
+            await self.client.close()
         
-    def run_typescript_agent(self, test_name: str = "default") -> Dict[str, Any]:
-        """Run the TypeScript agent and capture output"""
-        try:
-            # Change to TypeScript directory and run the new Agents SDK implementation
-            result = subprocess.run(
-                ["npx", "ts-node", "simple-agent.ts"],
-                cwd=self.ts_agent_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr,
-                "test_name": test_name
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "",
-                "error": "Timeout after 30 seconds",
-                "test_name": test_name
-            }
-        except Exception as e:
+    def _ts_command(self, script: str) -> List[str]:
+        """Build the argv for a TypeScript script, preferring its compiled dist/ output"""
+        # `npm run build` emits dist/*.js; running that with plain node skips
+        # ts-node's per-spawn npm resolution and TypeScript compilation.
+        # The build is stale if any .ts source (the script or anything it imports)
+        # was modified after it, so fall back to ts-node then.
+        compiled = os.path.join("dist", os.path.splitext(script)[0] + ".js")
+        compiled_path = os.path.join(self.ts_agent_path, compiled)
+        if os.path.exists(compiled_path):
+            newest_source = max((os.path.getmtime(path) for path in self._ts_sources()), default=0.0)
+            if os.path.getmtime(compiled_path) >= newest_source:
+                return ["node", compiled]
+        if os.path.exists(self._ts_node_bin):
+            return [self._ts_node_bin, script]
+        return ["npx", "ts-node", script]
+
+    def _ts_sources(self) -> List[str]:
+        """List the agent's .ts sources, skipping dependencies and build output"""
+        sources = []
+        for root, dirs, files in os.walk(self.ts_agent_path):
+            dirs[:] = sorted(d for d in dirs if d not in ("node_modules", "dist"))
+            sources.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(".ts"))
+        return sources
+
+    def _fingerprint(self, selected: Sequence[str]) -> str:
+        """Hash the inputs a run depends on: TypeScript sources, .env files, this module and the test selection"""
+        paths = [os.path.abspath(__file__), ".env", os.path.join(self.ts_agent_path, ".env")]
+        paths.extend(self._ts_sources())
+        
+        digest = hashlib.sha256(",".join(selected).encode("utf-8"))
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{path}\x00{stat.st_mtime_ns}\x00{stat.st_size}\x00".encode("utf-8"))
+        return digest.hexdigest()
+
+    def save_results(self, path: str) -> None:
+        """Write the collected results to a JSON file"""
+        with open(path, 'wb') as f:
+            f.write(_dump_results(self.results))
+
+    async def run_typescript_agent(self, test_name: str = "default") -> Dict[str, Any]:
+        """Run the TypeScript agent and capture its stdout as bytes"""
+        # Bound concurrent ts-node processes so added tests can't fork-storm the host
+        async with self._spawn_sem:
+            try:
+                # Change to TypeScript directory and run the new Agents SDK implementation
+                process = await asyncio.create_subprocess_exec(
+                    *self._ts_command("simple-agent.ts"),
+                    cwd=self.ts_agent_path,
+                    env=self._ts_env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=AGENT_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # Don't leave the ts-node child running past the timeout
+                    process.kill()
+                    await process.wait()
+                    return {
+                        "success": False,
+                        "output": b"",
+                        "error": f"Timeout after {AGENT_TIMEOUT} seconds",
+                        "test_name": test_name
+                    }
+                
+                return {
+                    "success": process.returncode == 0,
+                    "output": stdout,  # Raw bytes; callers decode only what they keep
+                    "error": stderr.decode("utf-8", errors="replace"),
+                    "test_name": test_name
+                }
+            except Exception as e:
+                return {
+                    "success": False,
+                    "output": b"",
+                    "error": str(e),
+                    "test_name": test_name
+                }
+
+    async def run_typescript_test_suite(self) -> Dict[str, Any]:
+        """Run the comprehensive TypeScript test suite, scanning its output as it streams"""
+        traces_flushed = otel_initialized = tests_ran = False
+        # Only the tail of the output is kept, for the preview shown on failure
+        tail = deque(maxlen=40)
+        
+        def scan_line(line: bytes) -> None:
+            nonlocal traces_flushed, otel_initialized, tests_ran
+            # Sentinels are matched on the raw bytes; only the kept tail is decoded
+            if not traces_flushed:
+                traces_flushed = b"Flushing traces" in line or b"spans flushed" in line
+            if not otel_initialized:
+                otel_initialized = b"OpenTelemetry initialized" in line
+            if not tests_ran:
+                tests_ran = b"Test Results:" in line or b"Starting comprehensive test suite" in line
+            tail.append(line)
+        
+        async def scan_stdout(stream: asyncio.StreamReader) -> None:
+            # Read fixed-size chunks and carry partial lines over, rather than
+            # readline(), whose 64 KiB limit fails on long log lines
+            pending = bytearray()
+            while True:
+                chunk = await stream.read(STDOUT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                pending += chunk
+                end = pending.rfind(b"\n")
+                if end < 0:
+                    continue
+                for line in bytes(pending[:end]).split(b"\n"):
+                    scan_line(line)
+                del pending[:end + 1]
+            if pending:
+                scan_line(bytes(pending))
+        
+        def suite_result(success: bool, error: str) -> Dict[str, Any]:
             return {
-                "success": False,
-                "output": "",
-                "error": str(e),
-                "test_name": test_name
+                "success": success,
+                # Lines can be any length, so cap the preview at the last 500 bytes
+                "output": b"\n".join(tail)[-500:].decode("utf-8", errors="replace"),
+                "error": error,
+                "test_name": "full_test_suite",
+                "traces_flushed": traces_flushed,
+                "otel_initialized": otel_initialized,
+                "tests_ran": tests_ran
             }
+        
+        # Bound concurrent ts-node processes so added tests can't fork-storm the host
+        async with self._spawn_sem:
+            process = None
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *self._ts_command("test-suite.ts"),
+                    cwd=self.ts_agent_path,
+                    env=self._ts_env,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    # Longer timeout for full test suite; stderr is drained alongside
+                    # stdout so neither pipe can fill up and stall the child
+                    _, stderr = await asyncio.wait_for(
+                        asyncio.gather(scan_stdout(process.stdout), process.stderr.read()),
+                        timeout=TEST_SUITE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    return suite_result(False, f"Test suite timeout after {TEST_SUITE_TIMEOUT} seconds")
+                
+                await process.wait()
+                return suite_result(process.returncode == 0, stderr.decode("utf-8", errors="replace"))
+            except Exception as e:
+                return suite_result(False, str(e))
+            finally:
+                # On any early exit, don't leave a ts-node child running and
+                # blocked on a pipe nobody reads any more
+                if process is not None and process.returncode is None:
+                    process.kill()
+                    await process.wait()
 
-    def run_typescript_test_suite(self) -> Dict[str, Any]:
-        """Run the comprehensive TypeScript test suite"""
-        try:
-            result = subprocess.run(
-                ["npx", "ts-node", "test-suite.ts"],
-                cwd=self.ts_agent_path,
-                capture_output=True,
-                text=True,
-                timeout=120  # Longer timeout for full test suite
-            )
+    async def _cached_completion(self, model: str, query: str) -> str:
+        """Return the OpenAI completion for a query, reusing a cached one while it is fresh"""
+        key = _completion_cache_key(model, query)
+        async with self._completion_lock:
+            entry = _read_completion_cache().get(key)
+            if entry and time.time() - entry["created_at"] < COMPLETION_CACHE_TTL:
+                return entry["content"]
             
-            return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr,
-                "test_name": "full_test_suite"
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "",
-                "error": "Test suite timeout after 120 seconds",
-                "test_name": "full_test_suite"
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "output": "",
-                "error": str(e),
-                "test_name": "full_test_suite"
-            }
+            if self.client is None:
+                raise RuntimeError("OPENAI_API_KEY not set")
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": query}],
+                max_tokens=200
+            )
+            content = response.choices[0].message.content
+            # flock blocks while another harness process holds it; keep that off the event loop
+            await asyncio.to_thread(_store_completion, key, {"content": content, "created_at": time.time()})
+            return content
 
-    def test_python_vs_typescript_consistency(self) -> Dict[str, Any]:
+    async def test_python_vs_typescript_consistency(self) -> Dict[str, Any]:
         """Test that Python and TypeScript agents give similar responses"""
         query = "What time is it right now? Respond with an ISO-8601 timestamp."
         
         # Test Python OpenAI direct
         try:
-            python_response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": query}],
-                max_tokens=200
-            )
-            python_result = python_response.choices[0].message.content
+            python_result = await self._cached_completion("gpt-4o-mini", query)
         except Exception as e:
             python_result = f"Error: {str(e)}"
         
         # Test TypeScript agent
-        ts_result = self.run_typescript_agent("consistency_test")
-        ts_output = ts_result.get("output", "")
+        ts_result = await self.run_typescript_agent("consistency_test")
+        ts_output = ts_result.get("output", b"")
         
-        # Extract the actual response from TypeScript output (remove debug info)
-        ts_lines = ts_output.strip().split('\n')
+        # Extract the actual response from TypeScript output (remove debug info),
+        # decoding only the line that is picked
+        ts_lines = ts_output.strip().split(b'\n')
         ts_response = ""
-        for line in ts_lines:
-            # Look for the agent response line
-            if "Agent Response:" in line:
-                # Extract everything after "Agent Response:"
-                ts_response = line.split("Agent Response:", 1)[1].strip()
-                break
+        # Look for the agent response line, stopping at the first hit
+        response_line = next((line for line in ts_lines if b"Agent Response:" in line), None)
+        if response_line is not None:
+            # Extract everything after "Agent Response:"
+            ts_response = response_line.split(b"Agent Response:", 1)[1].strip().decode("utf-8", errors="replace")
         
         if not ts_response:  # Fallback to first non-debug line
             for line in ts_lines:
-                if not any(line.startswith(prefix) for prefix in ["🤖", "📝", "✅", "🆔", "📊", "🔗", "📈", "🏷️", "🔄", "🎯"]):
-                    if line.strip() and not line.startswith("="):
-                        ts_response = line.strip()
-                        break
+                if line.strip() and not line.startswith(_DEBUG_PREFIXES) and not line.startswith(b"="):
+                    ts_response = line.strip().decode("utf-8", errors="replace")
+                    break
         
-        # Scoring
-        python_mentions_iso = 'iso' in python_result.lower() or 'ISO' in python_result
-        ts_mentions_iso = 'iso' in ts_response.lower() or 'ISO' in ts_response
+        # Scoring; a lowercase scan already covers 'ISO', so one pass per response
+        python_mentions_iso = 'iso' in python_result.lower()
+        ts_mentions_iso = 'iso' in ts_response.lower()
         
-        iso_pattern = r'\\d{4}-\\d{2}-\\d{2}T\\d{2}:\\d{2}:\\d{2}(?:\\.\\d+)?Z?'
-        python_has_timestamp = bool(re.search(iso_pattern, python_result))
-        ts_has_timestamp = bool(re.search(iso_pattern, ts_response))
+        python_has_timestamp = ISO8601_RE.search(python_result) is not None
+        ts_has_timestamp = ISO8601_RE.search(ts_response) is not None
         
-        consistency_score = 1.0 if python_mentions_iso == ts_mentions_iso else 0.5
+        flags = (
+            (python_mentions_iso << 3) | (ts_mentions_iso << 2)
+            | (python_has_timestamp << 1) | ts_has_timestamp
+        )
+        consistency_score = _CONSISTENCY_SCORES[flags]
         
         return {
             "test_name": "python_vs_typescript_consistency",
             "success": ts_result["success"] and consistency_score > 0,
             "python_response": python_result,
             "typescript_response": ts_response,
-            "typescript_raw_output": ts_output[:500] + "..." if len(ts_output) > 500 else ts_output,  # Debug info
+            "typescript_raw_output": ts_output[:500].decode("utf-8", errors="replace"),  # Debug info
             "python_mentions_iso": python_mentions_iso,
             "typescript_mentions_iso": ts_mentions_iso,
             "python_has_timestamp": python_has_timestamp,
@@ -147,48 +404,55 @@ class ComprehensiveEval:
             "typescript_error": ts_result.get("error", "")
         }
 
-    def check_aspire_dashboard_connectivity(self) -> Dict[str, Any]:
+    async def check_aspire_dashboard_connectivity(self) -> Dict[str, Any]:
         """Test connectivity to Aspire Dashboard OTLP endpoint"""
-        try:
-            # Test if the endpoint is reachable
-            response = requests.get("http://localhost:18888", timeout=5)
-            dashboard_reachable = response.status_code == 200
-        except:
-            dashboard_reachable = False
-            
-        try:
-            # Test OTLP endpoint (should give 400 for GET, but that means it's listening)
-            response = requests.get("http://localhost:18889/v1/traces", timeout=5)
-            otlp_reachable = response.status_code in [400, 405]  # Bad request or method not allowed is fine
-        except:
-            otlp_reachable = False
+        # Probe both endpoints at once so a down host costs one timeout, not two
+        dashboard_resp, otlp_resp = await asyncio.gather(
+            self.http.head("http://localhost:18888", timeout=5, follow_redirects=False),
+            self.http.head("http://localhost:18889/v1/traces", timeout=5),
+            return_exceptions=True
+        )
+        
+        # Network errors mean the endpoint is unreachable; anything else
+        # (including Ctrl-C) is not ours to swallow
+        for resp in (dashboard_resp, otlp_resp):
+            if isinstance(resp, BaseException) and not isinstance(resp, httpx.HTTPError):
+                raise resp
+        
+        # The redirect isn't followed, so a 3xx (e.g. token auth sending / to
+        # /login) counts as reachable alongside a plain 2xx
+        dashboard_reachable = (
+            isinstance(dashboard_resp, httpx.Response) and 200 <= dashboard_resp.status_code < 400
+        )
+        # OTLP endpoint should give 400/405 for HEAD, but that means it's listening
+        otlp_reachable = (
+            isinstance(otlp_resp, httpx.Response) and otlp_resp.status_code in [400, 405]
+        )
             
         return {
             "test_name": "aspire_connectivity",
             "success": dashboard_reachable and otlp_reachable,
             "dashboard_reachable": dashboard_reachable,
             "otlp_endpoint_reachable": otlp_reachable,
+            "dashboard_error": type(dashboard_resp).__name__ if isinstance(dashboard_resp, httpx.HTTPError) else None,
+            "otlp_error": type(otlp_resp).__name__ if isinstance(otlp_resp, httpx.HTTPError) else None,
             "dashboard_url": "http://localhost:18888",
             "otlp_url": "http://localhost:18889/v1/traces"
         }
 
-    def test_trace_generation(self) -> Dict[str, Any]:
+    async def test_trace_generation(self) -> Dict[str, Any]:
         """Run TypeScript agent and verify traces are generated"""
         print("\\n🔍 Testing trace generation...")
         
         # Run the test suite which should generate multiple traces
-        ts_result = self.run_typescript_test_suite()
-        
-        # Give time for traces to be exported
-        print("   Waiting 5 seconds for trace export...")
-        time.sleep(5)
+        ts_result = await self.run_typescript_test_suite()
         
         # Check if traces appear to be generated based on output
-        output = ts_result.get("output", "")
-        traces_flushed = "Flushing traces" in output or "spans flushed" in output
-        otel_initialized = "OpenTelemetry initialized" in output
-        tests_ran = "Test Results:" in output or "Starting comprehensive test suite" in output
+        traces_flushed = ts_result.get("traces_flushed", False)
+        otel_initialized = ts_result.get("otel_initialized", False)
+        tests_ran = ts_result.get("tests_ran", False)
         
+        output = ts_result.get("output", "")
         return {
             "test_name": "trace_generation",
             "success": ts_result["success"] and traces_flushed and otel_initialized,
@@ -196,31 +460,56 @@ class ComprehensiveEval:
             "traces_flushed": traces_flushed,
             "otel_initialized": otel_initialized,
             "tests_ran": tests_ran,
-            "output_preview": output[:500] + "..." if len(output) > 500 else output,
+            "output_preview": output,  # Last 500 bytes of the suite's output
             "error": ts_result.get("error", "")
         }
 
-    def run_all_evaluations(self) -> None:
-        """Run all evaluations and print comprehensive results"""
+    async def run_all_evaluations(self, only: Optional[Sequence[str]] = None, force: bool = False) -> None:
+        """Run the selected evaluations concurrently and print comprehensive results"""
         print("🚀 Starting Comprehensive Agent Evaluation")
         print("=" * 50)
         
-        # Test 1: Connectivity check
-        print("\\n1️⃣ Testing infrastructure connectivity...")
-        connectivity_result = self.check_aspire_dashboard_connectivity()
-        self.results.append(connectivity_result)
-        self.print_result(connectivity_result)
+        selected = [name for name in TEST_NAMES if not only or name in only]
+        cacheable = [name for name in selected if name not in UNCACHED_TESTS]
+        cache_path = os.path.join(RESULTS_CACHE_DIR, f"eval_results_{self._fingerprint(cacheable)}.json")
+        cached = None
+        if cacheable and not force:
+            cached = _load_cached_results(cache_path)
+            # A list that doesn't line up with the selection can't be trusted
+            if cached is not None and len(cached) != len(cacheable):
+                cached = None
+        if cached is not None:
+            print("♻️  Nothing changed since the last passing run, reusing its "
+                  f"{', '.join(cacheable)} results (--force to re-run)")
         
-        # Test 2: Trace generation
-        trace_result = self.test_trace_generation()
-        self.results.append(trace_result)
-        self.print_result(trace_result)
+        tests = {
+            "connectivity": self.check_aspire_dashboard_connectivity,
+            "trace": self.test_trace_generation,
+            "consistency": self.test_python_vs_typescript_consistency,
+        }
+        to_run = [name for name in selected if cached is None or name not in cacheable]
+        
+        # The tests share no state, so run them side by side and
+        # report in a fixed order once they have all finished
+        results = {}
+        if to_run:
+            print(f"⏱️  Running {', '.join(to_run)} tests concurrently...")
+            results.update(zip(to_run, await asyncio.gather(*(tests[name]() for name in to_run))))
+        if cached is not None:
+            results.update(zip(cacheable, cached))
+        
+        for name in selected:
+            self.results.append(results[name])
+            self.print_result(results[name])
         
-        # Test 3: Consistency between implementations
-        print("\\n3️⃣ Testing Python vs TypeScript consistency...")
-        consistency_result = self.test_python_vs_typescript_consistency()
-        self.results.append(consistency_result)
-        self.print_result(consistency_result)
+        # Only cache runs that passed, so failing tests are always re-run
+        if cached is None and cacheable and all(results[name]["success"] for name in cacheable):
+            os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+            # Write to a temp file and swap it in, so an interrupted run can't leave a truncated cache
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_results([results[name] for name in cacheable]))
+            os.replace(tmp_path, cache_path)
         
         # Final summary
         self.print_final_summary()
@@ -252,33 +541,52 @@ class ComprehensiveEval:
 
     def print_final_summary(self) -> None:
         """Print final evaluation summary"""
-        print("\\n" + "=" * 50)
-        print("📊 FINAL EVALUATION SUMMARY")
-        print("=" * 50)
-        
         total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r["success"])
+        passed_tests = sum(r["success"] for r in self.results)
         
-        print(f"\\n🎯 Overall Results: {passed_tests}/{total_tests} tests passed")
+        lines = [
+            "\\n" + "=" * 50,
+            "📊 FINAL EVALUATION SUMMARY",
+            "=" * 50,
+            f"\\n🎯 Overall Results: {passed_tests}/{total_tests} tests passed",
+        ]
         
         if passed_tests == total_tests:
-            print("🎉 ALL SYSTEMS OPERATIONAL!")
-            print("   ✅ Infrastructure connectivity verified")
-            print("   ✅ Tracing system working")
-            print("   ✅ Agent implementations consistent")
-            print("\\n🔗 Check your dashboards:")
-            print("   📊 Aspire Dashboard: http://localhost:18888")
-            print("   ☁️  Azure Application Insights: (check your Azure portal)")
+            # Only vouch for what actually ran; an --only run is partial
+            if total_tests == len(TEST_NAMES):
+                lines.append("🎉 ALL SYSTEMS OPERATIONAL!")
+            else:
+                lines.append("🎉 ALL SELECTED TESTS PASSED (partial run)")
+            lines += [_VERIFIED_LINES[r["test_name"]] for r in self.results]
+            lines += [
+                "\\n🔗 Check your dashboards:",
+                "   📊 Aspire Dashboard: http://localhost:18888",
+                "   ☁️  Azure Application Insights: (check your Azure portal)",
+            ]
         else:
-            print("⚠️  SOME ISSUES DETECTED:")
+            lines.append("⚠️  SOME ISSUES DETECTED:")
             for result in self.results:
                 if not result["success"]:
-                    print(f"   ❌ {result['test_name']}: {result.get('error', 'Failed')}")
-            print("\\n🔧 Please review the errors above and fix the issues.")
+                    lines.append(f"   ❌ {result['test_name']}: {result.get('error', 'Failed')}")
+            lines.append("\\n🔧 Please review the errors above and fix the issues.")
+        
+        print("\n".join(lines))
 
-def main():
+async def run_evaluations(only: Optional[Sequence[str]] = None, force: bool = False) -> None:
     evaluator = ComprehensiveEval()
-    evaluator.run_all_evaluations()
+    try:
+        await evaluator.run_all_evaluations(only=only, force=force)
+    finally:
+        await evaluator.aclose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--force", action="store_true",
+                        help="re-run the tests even if cached results match the current sources")
+    parser.add_argument("--only", action="append", choices=TEST_NAMES,
+                        help="run only this test (repeatable)")
+    args = parser.parse_args()
+    asyncio.run(run_evaluations(only=args.only, force=args.force))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
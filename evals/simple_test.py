@@ -2,29 +2,52 @@
 """
 Simple test to demonstrate eval functionality without full evals package
 """
+import functools
 import json
 import os
+import re
 from openai import OpenAI
 from dotenv import load_dotenv
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    # orjson parses small JSON documents several times faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Load environment variables from .env file
 load_dotenv()
 
+# ISO-8601 patterns like YYYY-MM-DDTHH:MM:SSZ or similar, compiled once per process
+ISO8601_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?')
+
+@functools.lru_cache(maxsize=1)
+def _openai_client() -> Optional[OpenAI]:
+    """Shared OpenAI client for the process, or None if no API key is set"""
+    api_key = os.getenv('OPENAI_API_KEY')
+    return OpenAI(api_key=api_key) if api_key else None
+
+def iter_eval(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield eval samples from a JSONL file one line at a time"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
+
 def test_time_query():
     """Test both implementations with a simple time query"""
     
     # Read the eval data
-    with open('data/simple_time_eval.jsonl', 'r') as f:
-        eval_data = json.loads(f.read().strip())
+    eval_data = next(iter_eval('data/simple_time_eval.jsonl'))
     
     print("=== Simple Eval Test ===")
     print(f"Test Query: {eval_data['input']}")
     print(f"Expected: {eval_data['ideal']}")
     
     # Test with OpenAI (simulating our TypeScript implementation)
-    if os.getenv('OPENAI_API_KEY'):
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        
+    client = _openai_client()
+    if client is not None:
         try:
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -37,10 +60,7 @@ def test_time_query():
             print(f"OpenAI Result: {result}")
             
             # Improved scoring: check if response contains ISO-8601 patterns
-            import re
-            # Look for ISO-8601 patterns like YYYY-MM-DDTHH:MM:SSZ or similar
-            iso_pattern = r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?'
-            contains_iso = bool(re.search(iso_pattern, result))
+            contains_iso = bool(ISO8601_RE.search(result))
             # Also check if it mentions ISO-8601 format or shows example format
             mentions_iso = 'iso' in result.lower() or 'ISO' in result
             # Award partial credit if it explains the format even without giving actual time
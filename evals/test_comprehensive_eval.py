@@ -0,0 +1,338 @@
+"""
+Unit tests for the caching, parsing and scoring logic in comprehensive_eval
+"""
+import asyncio
+import json
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import comprehensive_eval as ce
+
+
+class StubCompletions:
+    """Stands in for client.chat.completions, counting API calls"""
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=f"answer {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class StubClient:
+    """Stands in for AsyncOpenAI"""
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=StubCompletions())
+
+    async def close(self):
+        pass
+
+
+def make_results(success=True):
+    return {
+        "connectivity": {
+            "test_name": "aspire_connectivity", "success": success,
+            "dashboard_reachable": success, "otlp_endpoint_reachable": success,
+        },
+        "trace": {
+            "test_name": "trace_generation", "success": success,
+            "tests_ran": success, "otel_initialized": success, "traces_flushed": success,
+        },
+        "consistency": {
+            "test_name": "python_vs_typescript_consistency", "success": success,
+            "consistency_score": 1.0, "python_mentions_iso": True,
+            "typescript_mentions_iso": True, "typescript_response": "ISO",
+        },
+    }
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory with a fake agents-sdk-ts checkout and no API key"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    ts_dir = tmp_path / "agents-sdk-ts"
+    ts_dir.mkdir()
+    (ts_dir / "simple-agent.ts").write_text("console.log('hi');\n")
+    return tmp_path
+
+
+def make_evaluator(workdir, calls, success=True):
+    evaluator = ce.ComprehensiveEval()
+    evaluator.ts_agent_path = str(workdir / "agents-sdk-ts")
+    results = make_results(success)
+
+    def stub(name):
+        async def run():
+            calls.append(name)
+            return dict(results[name])
+        return run
+
+    evaluator.check_aspire_dashboard_connectivity = stub("connectivity")
+    evaluator.test_trace_generation = stub("trace")
+    evaluator.test_python_vs_typescript_consistency = stub("consistency")
+    return evaluator
+
+
+def run_evaluator(evaluator, **kwargs):
+    async def run():
+        try:
+            await evaluator.run_all_evaluations(**kwargs)
+        finally:
+            await evaluator.aclose()
+    asyncio.run(run())
+    return [r["test_name"] for r in evaluator.results]
+
+
+requires_node = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+def write_dist_script(workdir, name, source):
+    """Write a compiled-looking dist/<name> that is newer than every .ts source"""
+    dist = workdir / "agents-sdk-ts" / "dist"
+    dist.mkdir(exist_ok=True)
+    script = dist / name
+    script.write_text(source, encoding="utf-8")
+    later = time.time() + 10
+    os.utime(script, (later, later))
+
+
+def emit(text):
+    """JavaScript that writes text to stdout verbatim"""
+    return f"process.stdout.write({json.dumps(text)});\n"
+
+
+@pytest.mark.parametrize("text", [
+    "It is 2025-08-09T10:49:43Z now",
+    "2025-08-09T10:49:43.123Z",
+    "2025-08-09T10:49:43",
+])
+def test_iso8601_re_matches_timestamps(text):
+    assert ce.ISO8601_RE.search(text)
+
+
+@pytest.mark.parametrize("text", [
+    "2025-08-09 10:49:43",
+    "ISO-8601 looks like YYYY-MM-DDTHH:MM:SSZ",
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",
+])
+def test_iso8601_re_rejects_non_timestamps(text):
+    assert not ce.ISO8601_RE.search(text)
+
+
+@requires_node
+@pytest.mark.parametrize("python_text, ts_stdout, ts_response, ts_has_timestamp, score", [
+    # The "Agent Response:" line wins over debug lines around it
+    ("ISO-8601: 2025-01-01T10:00:00Z",
+     "🤖 Starting agent\n✅ Agent Response: The ISO time is 2025-01-01T10:00:00Z\n📊 done\n",
+     "The ISO time is 2025-01-01T10:00:00Z", True, 1.0),
+    # Without one, the first line that isn't debug output or a rule is used
+    ("ISO-8601: 2025-01-01T10:00:00Z",
+     "🤖 Starting agent\n🏷️ tagged\n==========\n\nIt is about noon\n",
+     "It is about noon", False, 0.5),
+    # Neither side mentions ISO, which still counts as agreement
+    ("Sorry, I can't tell the time",
+     "Agent Response: No clock available\n",
+     "No clock available", False, 1.0),
+])
+def test_consistency_parses_typescript_output_and_scores(
+    workdir, python_text, ts_stdout, ts_response, ts_has_timestamp, score
+):
+    write_dist_script(workdir, "simple-agent.js", emit(ts_stdout))
+    evaluator = ce.ComprehensiveEval()
+    evaluator.ts_agent_path = str(workdir / "agents-sdk-ts")
+
+    async def completion(model, query):
+        return python_text
+    evaluator._cached_completion = completion
+
+    async def run():
+        try:
+            return await evaluator.test_python_vs_typescript_consistency()
+        finally:
+            await evaluator.aclose()
+    result = asyncio.run(run())
+
+    assert result["typescript_success"]
+    assert result["typescript_response"] == ts_response
+    assert result["python_has_timestamp"] == bool(ce.ISO8601_RE.search(python_text))
+    assert result["typescript_has_timestamp"] == ts_has_timestamp
+    assert result["consistency_score"] == score
+
+
+@requires_node
+def test_test_suite_reader_handles_lines_longer_than_the_stream_limit(workdir):
+    write_dist_script(workdir, "test-suite.js", emit(
+        "OpenTelemetry initialized\n" + "x" * 200_000 + "\nTest Results: 3/3\nFlushing traces"
+    ))
+    evaluator = ce.ComprehensiveEval()
+    evaluator.ts_agent_path = str(workdir / "agents-sdk-ts")
+    result = asyncio.run(evaluator.run_typescript_test_suite())
+    asyncio.run(evaluator.aclose())
+
+    assert result["success"], result["error"]
+    assert result["otel_initialized"] and result["tests_ran"] and result["traces_flushed"]
+    assert len(result["output"]) <= 500
+    assert result["output"].endswith("Flushing traces")
+
+
+@requires_node
+def test_test_suite_timeout_kills_the_child(workdir, monkeypatch):
+    monkeypatch.setattr(ce, "TEST_SUITE_TIMEOUT", 1)
+    write_dist_script(
+        workdir, "test-suite.js",
+        "console.log('OpenTelemetry initialized');\n"
+        "console.log('pid=' + process.pid);\n"
+        "setInterval(() => {}, 1000);\n"
+    )
+    evaluator = ce.ComprehensiveEval()
+    evaluator.ts_agent_path = str(workdir / "agents-sdk-ts")
+    result = asyncio.run(evaluator.run_typescript_test_suite())
+    asyncio.run(evaluator.aclose())
+
+    assert not result["success"]
+    assert "timeout" in result["error"]
+    assert result["otel_initialized"]
+    pid = int(result["output"].split("pid=", 1)[1].split()[0])
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_cached_completion_reuses_fresh_entry_and_refetches_stale(workdir, monkeypatch):
+    evaluator = ce.ComprehensiveEval()
+    evaluator.client = StubClient()
+
+    async def ask():
+        return await evaluator._cached_completion("gpt-4o-mini", "what time is it")
+
+    assert asyncio.run(ask()) == "answer 1"
+    assert asyncio.run(ask()) == "answer 1"
+    assert evaluator.client.chat.completions.calls == 1
+
+    monkeypatch.setattr(ce, "COMPLETION_CACHE_TTL", 0)
+    assert asyncio.run(ask()) == "answer 2"
+    assert evaluator.client.chat.completions.calls == 2
+    asyncio.run(evaluator.aclose())
+
+
+def test_store_completion_keeps_entries_written_by_other_runs(workdir):
+    ce._store_completion("a", {"content": "first", "created_at": time.time()})
+    ce._store_completion("b", {"content": "second", "created_at": time.time()})
+    assert set(ce._read_completion_cache()) == {"a", "b"}
+
+
+def test_cached_completion_without_api_key_raises(workdir):
+    evaluator = ce.ComprehensiveEval()
+    assert evaluator.client is None
+    with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
+        asyncio.run(evaluator._cached_completion("gpt-4o-mini", "uncached query"))
+    asyncio.run(evaluator.aclose())
+
+
+def test_fingerprint_tracks_sources_and_selection(workdir):
+    evaluator = ce.ComprehensiveEval()
+    evaluator.ts_agent_path = str(workdir / "agents-sdk-ts")
+    baseline = evaluator._fingerprint(["trace", "consistency"])
+
+    assert evaluator._fingerprint(["trace", "consistency"]) == baseline
+    assert evaluator._fingerprint(["trace"]) != baseline
+
+    # Dependencies and build output don't count as sources
+    (workdir / "agents-sdk-ts" / "node_modules").mkdir()
+    (workdir / "agents-sdk-ts" / "node_modules" / "dep.ts").write_text("x")
+    assert evaluator._fingerprint(["trace", "consistency"]) == baseline
+
+    (workdir / "agents-sdk-ts" / "simple-agent.ts").write_text("console.log('changed');\n")
+    assert evaluator._fingerprint(["trace", "consistency"]) != baseline
+    asyncio.run(evaluator.aclose())
+
+
+def test_passing_run_is_reused_except_connectivity(workdir):
+    calls = []
+    assert run_evaluator(make_evaluator(workdir, calls)) == [
+        "aspire_connectivity", "trace_generation", "python_vs_typescript_consistency"
+    ]
+    assert calls == ["connectivity", "trace", "consistency"]
+
+    calls.clear()
+    assert run_evaluator(make_evaluator(workdir, calls)) == [
+        "aspire_connectivity", "trace_generation", "python_vs_typescript_consistency"
+    ]
+    assert calls == ["connectivity"]
+
+    calls.clear()
+    run_evaluator(make_evaluator(workdir, calls), force=True)
+    assert calls == ["connectivity", "trace", "consistency"]
+
+
+def test_cached_results_expire(workdir):
+    calls = []
+    run_evaluator(make_evaluator(workdir, calls))
+    stale = time.time() - ce.RESULTS_CACHE_TTL - 1
+    for name in os.listdir(ce.RESULTS_CACHE_DIR):
+        if name.startswith("eval_results_"):
+            os.utime(os.path.join(ce.RESULTS_CACHE_DIR, name), (stale, stale))
+
+    calls.clear()
+    run_evaluator(make_evaluator(workdir, calls))
+    assert calls == ["connectivity", "trace", "consistency"]
+
+
+def test_failing_run_is_not_cached(workdir):
+    calls = []
+    run_evaluator(make_evaluator(workdir, calls, success=False))
+    calls.clear()
+    run_evaluator(make_evaluator(workdir, calls, success=False))
+    assert calls == ["connectivity", "trace", "consistency"]
+
+
+def test_only_runs_the_selected_tests(workdir):
+    calls = []
+    assert run_evaluator(make_evaluator(workdir, calls), only=["consistency", "trace"]) == [
+        "trace_generation", "python_vs_typescript_consistency"
+    ]
+    assert calls == ["trace", "consistency"]
+
+    # A different selection has its own cache entry
+    calls.clear()
+    run_evaluator(make_evaluator(workdir, calls), only=["trace"])
+    assert calls == ["trace"]
+
+
+def test_ts_command_skips_build_older_than_any_source(workdir):
+    evaluator = ce.ComprehensiveEval()
+    ts_dir = workdir / "agents-sdk-ts"
+    evaluator.ts_agent_path = str(ts_dir)
+    evaluator._ts_node_bin = str(ts_dir / "missing-ts-node")
+    (ts_dir / "otel.ts").write_text("export {};\n")
+    (ts_dir / "dist").mkdir()
+    compiled = ts_dir / "dist" / "simple-agent.js"
+    compiled.write_text("console.log('hi');\n")
+    now = time.time()
+    for source in ("simple-agent.ts", "otel.ts"):
+        os.utime(ts_dir / source, (now - 10, now - 10))
+    assert evaluator._ts_command("simple-agent.ts") == ["node", os.path.join("dist", "simple-agent.js")]
+
+    # Editing an imported module without rebuilding makes the build stale
+    os.utime(ts_dir / "otel.ts", (now + 10, now + 10))
+    assert evaluator._ts_command("simple-agent.ts") == ["npx", "ts-node", "simple-agent.ts"]
+    asyncio.run(evaluator.aclose())
+
+
+def test_cached_results_of_the_wrong_length_are_ignored(workdir):
+    calls = []
+    run_evaluator(make_evaluator(workdir, calls))
+    for name in os.listdir(ce.RESULTS_CACHE_DIR):
+        if name.startswith("eval_results_"):
+            with open(os.path.join(ce.RESULTS_CACHE_DIR, name), 'wb') as f:
+                f.write(ce._dump_results([make_results()["trace"]]))
+
+    calls.clear()
+    run_evaluator(make_evaluator(workdir, calls))
+    assert calls == ["connectivity", "trace", "consistency"]
+    assert not [name for name in os.listdir(ce.RESULTS_CACHE_DIR) if name.endswith(".tmp")]